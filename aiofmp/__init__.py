@@ -5,7 +5,11 @@ This module provides a comprehensive async client for the FMP API with
 category-based organization for better code management.
 """
 
-from .analyst import AnalystCategory
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .base import (
     FMPAuthenticationError,
     FMPBaseClient,
@@ -17,27 +21,30 @@ from .base import (
     FMPServerError,
     current_harvest_category,
 )
-from .calendar import CalendarCategory
-from .chart import ChartCategory
-from .commodity import CommodityCategory
-from .company import CompanyCategory
-from .cot import CommitmentOfTradersCategory
-from .crypto import CryptoCategory
-from .dcf import DiscountedCashFlowCategory
-from .directory import DirectoryCategory
-from .economics import EconomicsCategory
-from .etf import EtfAndMutualFundsCategory
-from .forex import ForexCategory
-from .form13f import Form13FCategory
-from .indexes import IndexesCategory
-from .insider_trades import InsiderTradesCategory
-from .market_performance import MarketPerformanceCategory
-from .news import NewsCategory
-from .quote import QuoteCategory
-from .search import SearchCategory
-from .senate import SenateCategory
-from .statements import StatementsCategory
-from .technical_indicators import TechnicalIndicatorsCategory
+
+if TYPE_CHECKING:
+    from .analyst import AnalystCategory
+    from .calendar import CalendarCategory
+    from .chart import ChartCategory
+    from .commodity import CommodityCategory
+    from .company import CompanyCategory
+    from .cot import CommitmentOfTradersCategory
+    from .crypto import CryptoCategory
+    from .dcf import DiscountedCashFlowCategory
+    from .directory import DirectoryCategory
+    from .economics import EconomicsCategory
+    from .etf import EtfAndMutualFundsCategory
+    from .forex import ForexCategory
+    from .form13f import Form13FCategory
+    from .indexes import IndexesCategory
+    from .insider_trades import InsiderTradesCategory
+    from .market_performance import MarketPerformanceCategory
+    from .news import NewsCategory
+    from .quote import QuoteCategory
+    from .search import SearchCategory
+    from .senate import SenateCategory
+    from .statements import StatementsCategory
+    from .technical_indicators import TechnicalIndicatorsCategory
 
 __all__ = [
     "FmpClient",
@@ -51,6 +58,48 @@ __all__ = [
     "current_harvest_category",
 ]
 
+# Category classes, imported when the first FmpClient is constructed (or on
+# attribute access) so that importing the package, e.g. for the MCP server's
+# tool listing, does not load every category module.
+_CATEGORY_CLASSES = {
+    "AnalystCategory": "analyst",
+    "CalendarCategory": "calendar",
+    "ChartCategory": "chart",
+    "CommitmentOfTradersCategory": "cot",
+    "CommodityCategory": "commodity",
+    "CompanyCategory": "company",
+    "CryptoCategory": "crypto",
+    "DirectoryCategory": "directory",
+    "DiscountedCashFlowCategory": "dcf",
+    "EconomicsCategory": "economics",
+    "EtfAndMutualFundsCategory": "etf",
+    "ForexCategory": "forex",
+    "Form13FCategory": "form13f",
+    "IndexesCategory": "indexes",
+    "InsiderTradesCategory": "insider_trades",
+    "MarketPerformanceCategory": "market_performance",
+    "NewsCategory": "news",
+    "QuoteCategory": "quote",
+    "SearchCategory": "search",
+    "SenateCategory": "senate",
+    "StatementsCategory": "statements",
+    "TechnicalIndicatorsCategory": "technical_indicators",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import category classes on first access (PEP 562)."""
+    if name not in _CATEGORY_CLASSES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{_CATEGORY_CLASSES[name]}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _CATEGORY_CLASSES.keys())
+
 
 class FmpClient(FMPBaseClient):
     """
@@ -156,39 +205,48 @@ class FmpClient(FMPBaseClient):
         house_trades = await client.senate.house_trading_activity("AAPL")
     """
 
-    def __init__(self, api_key: str, **kwargs):
+    analyst: AnalystCategory
+    calendar: CalendarCategory
+    chart: ChartCategory
+    cot: CommitmentOfTradersCategory
+    commodity: CommodityCategory
+    company: CompanyCategory
+    crypto: CryptoCategory
+    directory: DirectoryCategory
+    dcf: DiscountedCashFlowCategory
+    economics: EconomicsCategory
+    etf: EtfAndMutualFundsCategory
+    forex: ForexCategory
+    form13f: Form13FCategory
+    indexes: IndexesCategory
+    insider_trades: InsiderTradesCategory
+    market_performance: MarketPerformanceCategory
+    news: NewsCategory
+    quote: QuoteCategory
+    search: SearchCategory
+    senate: SenateCategory
+    statements: StatementsCategory
+    technical_indicators: TechnicalIndicatorsCategory
+
+    def __init__(self, api_key: str, search_cache_ttl: float | None = None, **kwargs):
         """
         Initialize the FMP client
 
         Args:
             api_key: FMP API key (required)
+            search_cache_ttl: Seconds for which ``search`` reuses the response
+                to an identical symbol, company or screener query. Cached
+                responses are shared between callers and must not be mutated.
+                Default ``None`` disables the cache.
             **kwargs: Additional arguments passed to base client
         """
         super().__init__(api_key, **kwargs)
 
         # Initialize category modules
-        self.search = SearchCategory(self)
-        self.directory = DirectoryCategory(self)
-        self.analyst = AnalystCategory(self)
-        self.calendar = CalendarCategory(self)
-        self.chart = ChartCategory(self)
-        self.company = CompanyCategory(self)
-        self.cot = CommitmentOfTradersCategory(self)
-        self.dcf = DiscountedCashFlowCategory(self)
-        self.economics = EconomicsCategory(self)
-        self.etf = EtfAndMutualFundsCategory(self)
-        self.commodity = CommodityCategory(self)
-        self.crypto = CryptoCategory(self)
-        self.forex = ForexCategory(self)
-        self.statements = StatementsCategory(self)
-        self.form13f = Form13FCategory(self)
-        self.indexes = IndexesCategory(self)
-        self.insider_trades = InsiderTradesCategory(self)
-        self.market_performance = MarketPerformanceCategory(self)
-        self.news = NewsCategory(self)
-        self.technical_indicators = TechnicalIndicatorsCategory(self)
-        self.quote = QuoteCategory(self)
-        self.senate = SenateCategory(self)
+        options = {"search": {"cache_ttl": search_cache_ttl}}
+        for class_name, name in _CATEGORY_CLASSES.items():
+            category = __getattr__(class_name)
+            setattr(self, name, category(self, **options.get(name, {})))
 
         # Future categories will be added here:
         # self.financial = FinancialCategory(self)
@@ -7,6 +7,7 @@ including session management, rate limiting, and error handling.
 
 import asyncio
 import contextvars
+import json
 import logging
 import time
 from collections.abc import Callable
@@ -15,9 +16,24 @@ from urllib.parse import urlencode
 
 import aiohttp
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the ``orjson`` extra
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _loads(raw: bytes) -> Any:
+    """Decode a JSON response body, via orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity literals, which only the stdlib accepts
+    return json.loads(raw)
+
+
 class FMPError(Exception):
     """Base exception for FMP API errors"""
 
@@ -110,6 +126,7 @@ class FMPBaseClient:
         retry_delay: float = 1.0,
         max_concurrent_requests: int = 10,
         requests_per_minute: int | None = None,
+        persistent_connections: bool = False,
     ):
         """
         Initialize the FMP base client
@@ -126,6 +143,13 @@ class FMPBaseClient:
                 so the per-minute rate stays below the cap regardless of
                 concurrency. Default ``None`` disables pacing (server-side 429s
                 are the only ceiling).
+            persistent_connections: Keep the TCP connector (and its pooled
+                keep-alive connections and DNS cache) alive when the session is
+                torn down after the last active scope, so the next scope reuses
+                warm connections instead of reconnecting and redoing the TLS
+                handshake. Intended for long-lived shared clients such as the
+                MCP server's, whose owner must call :meth:`aclose` when done,
+                on the event loop that used the client.
         """
         if not api_key:
             raise ValueError("API key is required")
@@ -136,10 +160,15 @@ class FMPBaseClient:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.max_concurrent_requests = max_concurrent_requests
+        self.persistent_connections = persistent_connections
 
         # Session management
         self._session: aiohttp.ClientSession | None = None
         self._session_owner = True
+        # With persistent_connections, the connector outlives individual
+        # sessions; it is rebuilt only if closed or bound to a different loop.
+        self._connector: aiohttp.TCPConnector | None = None
+        self._connector_loop: asyncio.AbstractEventLoop | None = None
         # Reference count of active start()/`async with` scopes. A shared
         # client (e.g. the MCP server's global singleton) is entered
         # concurrently by many in-flight requests, each wrapping its work in
@@ -162,7 +191,7 @@ class FMPBaseClient:
         self.on_response_size: Callable[[str | None, int], None] | None = None
 
         # Logging
-        logger.info(f"FMP client initialized with base URL: {self.base_url}")
+        logger.info("FMP client initialized with base URL: %s", self.base_url)
         if self._rate_limiter is not None:
             logger.info(
                 "Rate limiter active: %d requests/minute (%.0fms between requests)",
@@ -188,7 +217,14 @@ class FMPBaseClient:
         async with self._session_lock:
             if self._session is None:
                 timeout = aiohttp.ClientTimeout(total=self.timeout)
-                self._session = aiohttp.ClientSession(timeout=timeout)
+                if self.persistent_connections:
+                    self._session = aiohttp.ClientSession(
+                        timeout=timeout,
+                        connector=await self._get_connector(),
+                        connector_owner=False,
+                    )
+                else:
+                    self._session = aiohttp.ClientSession(timeout=timeout)
                 self._session_owner = True
                 logger.debug("FMP client session started")
             # Count the scope only after a session is guaranteed to exist, so a
@@ -196,6 +232,54 @@ class FMPBaseClient:
             # __aenter__ means __aexit__/close() never runs to balance it).
             self._session_refcount += 1
 
+    async def _get_connector(self) -> aiohttp.TCPConnector:
+        """Return the persistent connector, creating it on the running loop."""
+        loop = asyncio.get_running_loop()
+        if (
+            self._connector is None
+            or self._connector.closed
+            or self._connector_loop is not loop
+        ):
+            await self._drop_connector()
+            self._connector = aiohttp.TCPConnector(
+                ttl_dns_cache=300, keepalive_timeout=75
+            )
+            self._connector_loop = loop
+            logger.debug("FMP client connector created")
+        return self._connector
+
+    async def _drop_connector(self) -> None:
+        """Close and forget the persistent connector, if there is one.
+
+        A connector can only be closed on the loop it was created on. One left
+        on another loop (e.g. by an earlier ``asyncio.run``) is just forgotten;
+        its pooled sockets are reclaimed only when garbage collected.
+        """
+        connector, loop = self._connector, self._connector_loop
+        self._connector = self._connector_loop = None
+        if connector is None or connector.closed:
+            return
+        if loop is asyncio.get_running_loop():
+            await connector.close()
+            logger.debug("FMP client connector closed")
+        else:
+            logger.debug("FMP client connector from another event loop dropped")
+
+    async def aclose(self):
+        """Shut the client down: close its session and persistent connector.
+
+        Unlike :meth:`close`, this ignores the scope reference count and is
+        meant to be called once, when the owner of a long-lived client (such as
+        the MCP server) is done with it.
+        """
+        async with self._session_lock:
+            self._session_refcount = 0
+            if self._session_owner and self._session is not None:
+                await self._session.close()
+                self._session = None
+                logger.debug("FMP client session closed")
+            await self._drop_connector()
+
     async def close(self):
         """Close the client session once the last active scope exits.
 
@@ -289,14 +373,19 @@ class FMPBaseClient:
                             f"Request timeout after {self.max_retries + 1} attempts"
                         ) from e
                     logger.warning(
-                        f"Request timeout, attempt {attempt + 1}/{self.max_retries + 1}"
+                        "Request timeout, attempt %d/%d",
+                        attempt + 1,
+                        self.max_retries + 1,
                     )
 
                 except aiohttp.ClientError as e:
                     if attempt == self.max_retries:
                         raise FMPError(f"HTTP client error: {e}") from e
                     logger.warning(
-                        f"HTTP client error, attempt {attempt + 1}/{self.max_retries + 1}: {e}"
+                        "HTTP client error, attempt %d/%d: %s",
+                        attempt + 1,
+                        self.max_retries + 1,
+                        e,
                     )
 
                 except FMPRateLimitError:
@@ -373,14 +462,12 @@ class FMPBaseClient:
                     except Exception:
                         logger.exception("on_response_size callback raised; ignoring")
 
-                import json  # local import keeps top of file unchanged
-
                 # Some FMP endpoints return status 200 with an empty or
                 # whitespace-only body when the resource isn't included in
                 # the caller's plan (instead of a clean 402). Treat those as
                 # "no data" silently so per-item loops don't trip on a JSON
                 # decode error.
-                data = json.loads(raw) if raw.strip() else None
+                data = _loads(raw) if raw.strip() else None
 
                 if isinstance(data, dict) and "Error Message" in data:
                     raise FMPResponseError(f"API Error: {data['Error Message']}")
@@ -119,6 +119,10 @@ class CachedClient:
         await self._fmp.close()
         await self._storage.close()
 
+    async def aclose(self) -> None:
+        """Shut down the wrapped client's session and persistent connector."""
+        await self._fmp.aclose()
+
     @property
     def storage(self) -> StorageBackend:
         """Access the underlying storage backend."""
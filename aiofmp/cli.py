@@ -4,14 +4,13 @@ Command Line Interface for aiofmp
 This module provides the CLI entrypoint for running the MCP server.
 """
 
-import asyncio
 import logging
 import os
 import sys
 
 import click
 
-from .mcp_server import run_server
+from .mcp_server import main as run_mcp_server
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -191,7 +190,7 @@ def mcp_server(
         logger.info(f"Server will be available at http://{host}:{port}")
 
     try:
-        asyncio.run(run_server())
+        run_mcp_server()
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
@@ -8,41 +8,66 @@ returned client is a :class:`~aiofmp.cachedclient.CachedClient` that
 transparently caches time-series data in local Parquet files.
 """
 
+import functools
 import os
 
 from . import FmpClient
 from .base import FMPAuthenticationError
 
-# Global client instance (FmpClient or CachedClient)
-_fmp_client: FmpClient | None = None
+# Agents re-issue identical search and screener queries while iterating on
+# tool calls; the shared client reuses those responses for this long.
+_SEARCH_CACHE_TTL = 60.0
+
+
+def _evict_client() -> FmpClient | None:
+    """Forget the shared client, returning it if one had been built."""
+    client = get_fmp_client() if get_fmp_client.cache_info().currsize else None
+    get_fmp_client.cache_clear()
+    return client
 
 
 def reset_fmp_client():
-    """Reset the global FMP client instance (for testing)."""
-    global _fmp_client
-    _fmp_client = None
+    """Reset the global FMP client instance (for testing).
+
+    The next :func:`get_fmp_client` call re-reads the environment. The old
+    client is not shut down; use :func:`close_fmp_client` for that.
+    """
+    _evict_client()
 
 
+async def close_fmp_client() -> None:
+    """Shut down the global FMP client, if one was built, and forget it."""
+    client = _evict_client()
+    if client is not None:
+        await client.aclose()
+
+
+@functools.cache
 def get_fmp_client() -> FmpClient:
     """Get or create the FMP client instance.
 
+    The client is built from ``FMP_API_KEY`` and ``AIOFMP_CACHED`` on the first
+    call and memoized, so later calls return the same client (and its
+    session/connection pool) without touching the environment. Only
+    :func:`reset_fmp_client` and :func:`close_fmp_client` discard it.
+
     If ``AIOFMP_CACHED=true`` the returned object is a
     :class:`~aiofmp.cachedclient.CachedClient` wrapping a real ``FmpClient``.
     The ``CachedClient`` is API-compatible (same category attributes and
     context-manager protocol) so all MCP tools work without modification.
     """
-    global _fmp_client
-    if _fmp_client is None:
-        api_key = os.getenv("FMP_API_KEY")
-        if not api_key:
-            raise FMPAuthenticationError("FMP_API_KEY environment variable is required")
+    api_key = os.getenv("FMP_API_KEY")
+    if not api_key:
+        raise FMPAuthenticationError("FMP_API_KEY environment variable is required")
 
-        fmp = FmpClient(api_key=api_key)
+    fmp = FmpClient(
+        api_key=api_key,
+        persistent_connections=True,
+        search_cache_ttl=_SEARCH_CACHE_TTL,
+    )
 
-        if os.getenv("AIOFMP_CACHED", "").lower() == "true":
-            from .cachedclient import CachedClient
+    if os.getenv("AIOFMP_CACHED", "").lower() == "true":
+        from .cachedclient import CachedClient
 
-            _fmp_client = CachedClient(fmp)
-        else:
-            _fmp_client = fmp
-    return _fmp_client
+        return CachedClient(fmp)
+    return fmp
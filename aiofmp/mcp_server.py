@@ -6,6 +6,7 @@ exposing all FMP API endpoints as MCP tools for use with AI assistants.
 """
 
 import asyncio
+import functools
 import importlib
 import logging
 import os
@@ -13,6 +14,12 @@ import sys
 
 from fastmcp import FastMCP
 
+try:
+    import uvloop
+except ImportError:  # optional speedup, see the ``uvloop`` extra
+    uvloop = None
+
+from .fmp_client import close_fmp_client
 from .mcp_selection import (
     compute_selection,
     get_tool_inventory,
@@ -26,6 +33,9 @@ logger = logging.getLogger(__name__)
 # Initialize FastMCP server
 mcp = FastMCP("FMP MCP Server")
 
+# Exit hook for run_server; a module-level name so tests can swap it out
+_exit = sys.exit
+
 
 def _resolve_selection_from_env() -> dict[str, frozenset[str]]:
     """Read ``AIOFMP_MCP_TOOLS`` / ``AIOFMP_MCP_EXCLUDE_TOOLS`` and resolve.
@@ -41,6 +51,12 @@ def _resolve_selection_from_env() -> dict[str, frozenset[str]]:
     return compute_selection(include, exclude, inventory)
 
 
+@functools.lru_cache(maxsize=4)
+def _mask_api_key(api_key: str) -> str:
+    """Return ``api_key`` with all but its last four characters masked."""
+    return "*" * (len(api_key) - 4) + api_key[-4:] if len(api_key) > 4 else "****"
+
+
 def register_tools(selection: dict[str, frozenset[str]] | None = None) -> None:
     """Register MCP tools, optionally restricted to a per-category allow-set.
 
@@ -85,10 +101,10 @@ def register_tools(selection: dict[str, frozenset[str]] | None = None) -> None:
             removed,
         )
     except ImportError as e:
-        logger.error(f"Failed to import tool modules: {e}")
+        logger.error("Failed to import tool modules: %s", e)
         raise
     except Exception as e:
-        logger.error(f"Failed to register tools: {e}")
+        logger.error("Failed to register tools: %s", e)
         raise
 
 
@@ -115,21 +131,20 @@ async def run_server():
         api_key = os.getenv("FMP_API_KEY")
         if not api_key:
             logger.error("FMP_API_KEY environment variable is required")
-            sys.exit(1)
+            _exit(1)
             return  # This line will never be reached, but helps with static analysis
 
         # Register tools and setup error handling
         register_tools()
         setup_error_handling()
 
-        logger.info(f"Starting FMP MCP Server with {transport} transport")
-        logger.info(
-            f"API Key: {'*' * (len(api_key) - 4) + api_key[-4:] if len(api_key) > 4 else '****'}"
-        )
+        logger.info("Starting FMP MCP Server with %s transport", transport)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("API Key: %s", _mask_api_key(api_key))
 
         # Run the server based on transport type
         if transport == "http":
-            logger.info(f"Starting HTTP server on {host}:{port}")
+            logger.info("Starting HTTP server on %s:%d", host, port)
             await mcp.run_async(transport="http", host=host, port=port)
         else:
             logger.info("Starting STDIO server")
@@ -138,13 +153,21 @@ async def run_server():
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Server error: {e}")
-        sys.exit(1)
+        logger.error("Server error: %s", e)
+        _exit(1)
+    finally:
+        await close_fmp_client()
 
 
 def main():
-    """Main entry point for the MCP server."""
-    asyncio.run(run_server())
+    """Main entry point for the MCP server.
+
+    Runs on uvloop when it is installed; otherwise the stdlib event loop.
+    """
+    if uvloop is not None:
+        uvloop.run(run_server())
+    else:
+        asyncio.run(run_server())
 
 
 if __name__ == "__main__":
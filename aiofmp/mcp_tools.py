@@ -5,15 +5,47 @@ This module provides utilities for creating and managing MCP tools
 for the Financial Modeling Prep API.
 """
 
+import functools
+import json
 import logging
+import math
+import re
 from typing import Any
 
 from fastmcp.tools.tool import ToolResult
 
 from .mcp_server import mcp
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the ``orjson`` extra
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+_SYMBOLS_RE = re.compile(r"[^,\s]+")
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool response as indented JSON, via orjson when installed.
+
+    orjson writes NaN/Infinity as ``null`` (they are not valid JSON) and
+    rejects integers wider than 64 bits; those fall back to the stdlib.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except (TypeError, orjson.JSONEncodeError):
+            pass
+    return json.dumps(obj, indent=2)
+
+
+# (divisor, suffix) for format_large_number, indexed by 4 - (exponent // 3)
+_SCALES = ((1e12, "T"), (1e9, "B"), (1e6, "M"), (1e3, "K"), (1, ""))
+
 
 def create_tool_response(
     data: Any, success: bool = True, message: str = ""
@@ -43,9 +75,7 @@ def create_tool_response(
 
     if include_text_content:
         # Return both text and structured content
-        import json
-
-        text_content = json.dumps(response, indent=2)
+        text_content = _dumps(response)
         return ToolResult(content=text_content, structured_content=response)
     else:
         # Return with structured content only (text content empty when structured content is present)
@@ -60,17 +90,20 @@ def handle_async_operation(operation_name: str):
         operation_name: Name of the operation for logging
     """
 
+    error_prefix = f"Error in {operation_name}"
+
     def decorator(func):
+        @functools.wraps(func)
         async def wrapper(*args, **kwargs):
             try:
-                logger.info(f"Starting {operation_name}")
+                logger.info("Starting %s", operation_name)
                 result = await func(*args, **kwargs)
-                logger.info(f"Completed {operation_name} successfully")
+                logger.info("Completed %s successfully", operation_name)
                 return create_tool_response(result, success=True)
             except Exception as e:
-                logger.error(f"Error in {operation_name}: {e}")
+                logger.error("%s: %s", error_prefix, e)
                 return create_tool_response(
-                    None, success=False, message=f"Error in {operation_name}: {str(e)}"
+                    None, success=False, message=f"{error_prefix}: {e}"
                 )
 
         return wrapper
@@ -103,6 +136,31 @@ def validate_symbol(symbol: str) -> str:
     return normalized
 
 
+def validate_symbols(symbols: str) -> list[str]:
+    """
+    Validate and normalize a comma-separated list of stock symbols.
+
+    Args:
+        symbols: Comma-separated stock symbols, e.g. "aapl, MSFT,googl"
+
+    Returns:
+        List of normalized symbols
+
+    Raises:
+        ValueError: If no symbol is present
+    """
+    if not symbols or not isinstance(symbols, str):
+        raise ValueError("Symbols must be a non-empty string")
+
+    # One regex scan over the uppercased string splits and trims every entry
+    normalized = _SYMBOLS_RE.findall(symbols.upper())
+
+    if not normalized:
+        raise ValueError("Symbols cannot be empty")
+
+    return normalized
+
+
 def validate_date(date_str: str | None) -> str | None:
     """
     Validate a date string in YYYY-MM-DD format.
@@ -122,18 +180,9 @@ def validate_date(date_str: str | None) -> str | None:
     if not isinstance(date_str, str):
         raise ValueError("Date must be a string")
 
-    # Basic format validation
-    if len(date_str) != 10 or date_str.count("-") != 2:
+    if not _DATE_RE.fullmatch(date_str):
         raise ValueError("Date must be in YYYY-MM-DD format")
 
-    try:
-        year, month, day = date_str.split("-")
-        int(year)
-        int(month)
-        int(day)
-    except ValueError as e:
-        raise ValueError("Date must be in YYYY-MM-DD format") from e
-
     return date_str
 
 
@@ -240,16 +289,10 @@ def format_large_number(value: float | None) -> str:
     if value is None:
         return "N/A"
 
-    if value >= 1e12:
-        return f"{value / 1e12:.2f}T"
-    elif value >= 1e9:
-        return f"{value / 1e9:.2f}B"
-    elif value >= 1e6:
-        return f"{value / 1e6:.2f}M"
-    elif value >= 1e3:
-        return f"{value / 1e3:.2f}K"
-    else:
-        return f"{value:.2f}"
+    magnitude = abs(value)
+    exponent = int(math.log10(magnitude)) if 1 <= magnitude < math.inf else 0
+    divisor, suffix = _SCALES[max(0, 4 - exponent // 3)]
+    return f"{value / divisor:.2f}{suffix}"
 
 
 def create_summary_stats(data: list[dict[str, Any]], key: str) -> dict[str, Any]:
@@ -266,7 +309,7 @@ def create_summary_stats(data: list[dict[str, Any]], key: str) -> dict[str, Any]
     if not data:
         return {"count": 0, "min": None, "max": None, "avg": None}
 
-    values = [item.get(key) for item in data if item.get(key) is not None]
+    values = [value for item in data if (value := item.get(key)) is not None]
 
     if not values:
         return {"count": len(data), "min": None, "max": None, "avg": None}
@@ -285,6 +328,7 @@ __all__ = [
     "create_tool_response",
     "handle_async_operation",
     "validate_symbol",
+    "validate_symbols",
     "validate_date",
     "validate_limit",
     "validate_page",
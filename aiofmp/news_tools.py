@@ -15,6 +15,7 @@ from .mcp_tools import (
     validate_date,
     validate_limit,
     validate_page,
+    validate_symbols,
 )
 
 logger = logging.getLogger(__name__)
@@ -395,8 +396,7 @@ async def search_press_releases(
     """
     try:
         # Validate inputs
-        if not symbols or not isinstance(symbols, str):
-            raise ValueError("Symbols must be a non-empty string")
+        validated_symbols = ",".join(validate_symbols(symbols))
 
         validated_page = validate_page(page)
         validated_limit = validate_limit(limit)
@@ -407,7 +407,7 @@ async def search_press_releases(
         client = get_fmp_client()
         async with client:
             results = await client.news.search_press_releases(
-                symbols=symbols,
+                symbols=validated_symbols,
                 page=validated_page,
                 limit=validated_limit,
                 from_date=validated_from_date,
@@ -417,7 +417,7 @@ async def search_press_releases(
         return create_tool_response(
             data=results,
             success=True,
-            message=f"Retrieved {len(results)} press releases for {symbols}",
+            message=f"Retrieved {len(results)} press releases for {validated_symbols}",
         )
 
     except Exception as e:
@@ -460,8 +460,7 @@ async def search_stock_news(
     """
     try:
         # Validate inputs
-        if not symbols or not isinstance(symbols, str):
-            raise ValueError("Symbols must be a non-empty string")
+        validated_symbols = ",".join(validate_symbols(symbols))
 
         validated_page = validate_page(page)
         validated_limit = validate_limit(limit)
@@ -472,7 +471,7 @@ async def search_stock_news(
         client = get_fmp_client()
         async with client:
             results = await client.news.search_stock_news(
-                symbols=symbols,
+                symbols=validated_symbols,
                 page=validated_page,
                 limit=validated_limit,
                 from_date=validated_from_date,
@@ -482,7 +481,7 @@ async def search_stock_news(
         return create_tool_response(
             data=results,
             success=True,
-            message=f"Retrieved {len(results)} stock news articles for {symbols}",
+            message=f"Retrieved {len(results)} stock news articles for {validated_symbols}",
         )
 
     except Exception as e:
@@ -525,8 +524,7 @@ async def search_crypto_news(
     """
     try:
         # Validate inputs
-        if not symbols or not isinstance(symbols, str):
-            raise ValueError("Symbols must be a non-empty string")
+        validated_symbols = ",".join(validate_symbols(symbols))
 
         validated_page = validate_page(page)
         validated_limit = validate_limit(limit)
@@ -537,7 +535,7 @@ async def search_crypto_news(
         client = get_fmp_client()
         async with client:
             results = await client.news.search_crypto_news(
-                symbols=symbols,
+                symbols=validated_symbols,
                 page=validated_page,
                 limit=validated_limit,
                 from_date=validated_from_date,
@@ -547,7 +545,7 @@ async def search_crypto_news(
         return create_tool_response(
             data=results,
             success=True,
-            message=f"Retrieved {len(results)} crypto news articles for {symbols}",
+            message=f"Retrieved {len(results)} crypto news articles for {validated_symbols}",
         )
 
     except Exception as e:
@@ -590,8 +588,7 @@ async def search_forex_news(
     """
     try:
         # Validate inputs
-        if not symbols or not isinstance(symbols, str):
-            raise ValueError("Symbols must be a non-empty string")
+        validated_symbols = ",".join(validate_symbols(symbols))
 
         validated_page = validate_page(page)
         validated_limit = validate_limit(limit)
@@ -602,7 +599,7 @@ async def search_forex_news(
         client = get_fmp_client()
         async with client:
             results = await client.news.search_forex_news(
-                symbols=symbols,
+                symbols=validated_symbols,
                 page=validated_page,
                 limit=validated_limit,
                 from_date=validated_from_date,
@@ -612,7 +609,7 @@ async def search_forex_news(
         return create_tool_response(
             data=results,
             success=True,
-            message=f"Retrieved {len(results)} forex news articles for {symbols}",
+            message=f"Retrieved {len(results)} forex news articles for {validated_symbols}",
         )
 
     except Exception as e:
@@ -5,6 +5,8 @@ This module provides search functionality including symbol search, company name
 and stock screening capabilities.
 """
 
+import time
+from collections import OrderedDict
 from typing import Any
 
 from .base import FMPBaseClient
@@ -13,14 +15,87 @@ from .base import FMPBaseClient
 class SearchCategory:
     """Search category for FMP API endpoints"""
 
-    def __init__(self, client: FMPBaseClient):
+    # Search and screener results are re-requested verbatim by agents iterating
+    # on tool calls, so with ``cache_ttl`` set identical queries are served from
+    # a small in-memory TTL cache. Requests asking for more than
+    # ``_CACHE_MAX_LIMIT`` rows bypass it so a few bulk screens can't evict
+    # everything else.
+    _CACHE_MAXSIZE = 256
+    _CACHE_MAX_LIMIT = 1000
+
+    # (keyword argument, API parameter) pairs accepted by screener()
+    _SCREENER_FIELDS = (
+        ("market_cap_more_than", "marketCapMoreThan"),
+        ("market_cap_lower_than", "marketCapLowerThan"),
+        ("sector", "sector"),
+        ("industry", "industry"),
+        ("beta_more_than", "betaMoreThan"),
+        ("beta_lower_than", "betaLowerThan"),
+        ("price_more_than", "priceMoreThan"),
+        ("price_lower_than", "priceLowerThan"),
+        ("dividend_more_than", "dividendMoreThan"),
+        ("dividend_lower_than", "dividendLowerThan"),
+        ("volume_more_than", "volumeMoreThan"),
+        ("volume_lower_than", "volumeLowerThan"),
+        ("exchange", "exchange"),
+        ("country", "country"),
+        ("is_etf", "isEtf"),
+        ("is_fund", "isFund"),
+        ("is_actively_trading", "isActivelyTrading"),
+        ("limit", "limit"),
+        ("include_all_share_classes", "includeAllShareClasses"),
+    )
+
+    def __init__(self, client: FMPBaseClient, cache_ttl: float | None = None):
         """
         Initialize the search category
 
         Args:
             client: Base FMP client instance
+            cache_ttl: Seconds to reuse an identical query's response. Cached
+                responses are shared between callers and must not be mutated.
+                Default ``None`` disables caching.
         """
         self._client = client
+        self._cache_ttl = cache_ttl
+        self._cache: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+
+    async def _cached_request(
+        self, endpoint: str, params: dict[str, Any], key: tuple | None = None
+    ) -> Any:
+        """
+        Make a request through the category's TTL cache, if enabled
+
+        Args:
+            endpoint: API endpoint (without base URL)
+            params: Query parameters
+            key: Precomputed cache key; defaults to the endpoint plus the
+                sorted params
+
+        Returns:
+            API response data, shared with any other caller that hit the same
+            cache entry (callers must not mutate it)
+        """
+        limit = params.get("limit")
+        if self._cache_ttl is None or (
+            limit is not None and limit > self._CACHE_MAX_LIMIT
+        ):
+            return await self._client._make_request(endpoint, params)
+
+        if key is None:
+            key = (endpoint, tuple(sorted(params.items())))
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > now:
+            self._cache.move_to_end(key)
+            return entry[1]
+
+        data = await self._client._make_request(endpoint, params)
+        self._cache[key] = (now + self._cache_ttl, data)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._CACHE_MAXSIZE:
+            self._cache.popitem(last=False)
+        return data
 
     async def symbols(
         self, query: str, limit: int | None = None, exchange: str | None = None
@@ -48,7 +123,7 @@ class SearchCategory:
         if exchange is not None:
             params["exchange"] = exchange
 
-        return await self._client._make_request("search-symbol", params)
+        return await self._cached_request("search-symbol", params)
 
     async def companies(
         self, query: str, limit: int | None = None, exchange: str | None = None
@@ -76,7 +151,7 @@ class SearchCategory:
         if exchange is not None:
             params["exchange"] = exchange
 
-        return await self._client._make_request("search-name", params)
+        return await self._cached_request("search-name", params)
 
     async def screener(
         self,
@@ -139,46 +214,17 @@ class SearchCategory:
             ... )
             >>> # Returns: [{"symbol": "AAPL", "companyName": "Apple Inc.", ...}]
         """
-        # Build parameters dict, filtering out None values
-        params = {}
-
-        if market_cap_more_than is not None:
-            params["marketCapMoreThan"] = market_cap_more_than
-        if market_cap_lower_than is not None:
-            params["marketCapLowerThan"] = market_cap_lower_than
-        if sector is not None:
-            params["sector"] = sector
-        if industry is not None:
-            params["industry"] = industry
-        if beta_more_than is not None:
-            params["betaMoreThan"] = beta_more_than
-        if beta_lower_than is not None:
-            params["betaLowerThan"] = beta_lower_than
-        if price_more_than is not None:
-            params["priceMoreThan"] = price_more_than
-        if price_lower_than is not None:
-            params["priceLowerThan"] = price_lower_than
-        if dividend_more_than is not None:
-            params["dividendMoreThan"] = dividend_more_than
-        if dividend_lower_than is not None:
-            params["dividendLowerThan"] = dividend_lower_than
-        if volume_more_than is not None:
-            params["volumeMoreThan"] = volume_more_than
-        if volume_lower_than is not None:
-            params["volumeLowerThan"] = volume_lower_than
-        if exchange is not None:
-            params["exchange"] = exchange
-        if country is not None:
-            params["country"] = country
-        if is_etf is not None:
-            params["isEtf"] = is_etf
-        if is_fund is not None:
-            params["isFund"] = is_fund
-        if is_actively_trading is not None:
-            params["isActivelyTrading"] = is_actively_trading
-        if limit is not None:
-            params["limit"] = limit
-        if include_all_share_classes is not None:
-            params["includeAllShareClasses"] = include_all_share_classes
-
-        return await self._client._make_request("company-screener", params)
+        # Map the keyword arguments onto API params, filtering out None values.
+        # The values in table order (None for unset) double as the cache key,
+        # so no per-call sort of the params is needed.
+        args = locals()
+        values = tuple(args[name] for name, _ in self._SCREENER_FIELDS)
+        params = {
+            api_name: value
+            for (_, api_name), value in zip(self._SCREENER_FIELDS, values, strict=True)
+            if value is not None
+        }
+
+        return await self._cached_request(
+            "company-screener", params, key=("company-screener", values)
+        )
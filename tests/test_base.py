@@ -9,9 +9,11 @@ out from under the others (which produced "Connector is closed" and
 """
 
 import asyncio
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
 from aiofmp.base import FMPBaseClient
 
@@ -156,3 +158,120 @@ class TestSessionLifecycle:
         assert not any(observed_closed_mid_request)
         # And everything is cleaned up after the last scope exits.
         assert client._session is None
+
+
+class _RecordingSession(_FakeSession):
+    """Fake session that also remembers the kwargs it was built with."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.kwargs = kwargs
+
+
+class TestPersistentConnections:
+    """persistent_connections keeps the connector warm across session cycles."""
+
+    @pytest.mark.asyncio
+    async def test_connector_reused_across_session_cycles(self):
+        client = FMPBaseClient(api_key="test", persistent_connections=True)
+        with patch("aiofmp.base.aiohttp.ClientSession", _RecordingSession):
+            async with client:
+                first = client._session
+            async with client:
+                second = client._session
+
+        assert first is not second
+        assert first.closed and second.closed
+        connector = first.kwargs["connector"]
+        assert second.kwargs["connector"] is connector
+        assert first.kwargs["connector_owner"] is False
+        assert not connector.closed
+        await connector.close()
+
+    @pytest.mark.asyncio
+    async def test_closed_connector_is_rebuilt(self):
+        client = FMPBaseClient(api_key="test", persistent_connections=True)
+        with patch("aiofmp.base.aiohttp.ClientSession", _RecordingSession):
+            async with client:
+                first = client._session.kwargs["connector"]
+            await first.close()
+            async with client:
+                second = client._session.kwargs["connector"]
+
+        assert second is not first
+        assert not second.closed
+        await second.close()
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_pooled_connections(self):
+        """A real request leaves a pooled connection; aclose() must close it."""
+
+        async def handler(request):
+            return web.json_response([])
+
+        app = web.Application()
+        app.router.add_get("/", handler)
+        async with TestServer(app) as server:
+            client = FMPBaseClient(api_key="test", persistent_connections=True)
+            async with client:
+                async with client._session.get(server.make_url("/")) as response:
+                    await response.read()
+            connector = client._connector
+            assert not connector.closed
+
+            await client.aclose()
+
+        assert connector.closed
+        assert client._connector is None
+        assert client._session is None
+
+    @pytest.mark.asyncio
+    async def test_connector_from_previous_loop_is_replaced(self):
+        """A connector bound to another loop is dropped, not closed from here."""
+        client = FMPBaseClient(api_key="test", persistent_connections=True)
+        with patch("aiofmp.base.aiohttp.ClientSession", _RecordingSession):
+            async with client:
+                first = client._session.kwargs["connector"]
+            # Simulate the client having been used under an earlier event loop
+            stale_loop = asyncio.new_event_loop()
+            stale_loop.close()
+            client._connector_loop = stale_loop
+            async with client:
+                second = client._session.kwargs["connector"]
+
+        assert second is not first
+        assert not first.closed
+        await first.close()
+        await client.aclose()
+        assert second.closed
+
+    @pytest.mark.asyncio
+    async def test_default_sessions_own_their_connector(self):
+        client = FMPBaseClient(api_key="test")
+        with patch("aiofmp.base.aiohttp.ClientSession", _RecordingSession):
+            async with client:
+                session = client._session
+
+        assert "connector" not in session.kwargs
+        assert client._connector is None
+
+
+class TestResponseDecoding:
+    """Response bodies decode the same with or without the orjson extra."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    async def test_body_decoded_with_and_without_orjson(self, monkeypatch, use_orjson):
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr("aiofmp.base.orjson", None)
+        client = FMPBaseClient(api_key="test")
+
+        response = MagicMock()
+        response.status = 200
+        response.read = AsyncMock(return_value=b'[{"symbol": "AAPL", "pe": NaN}]')
+
+        result = await client._handle_response(response)
+        assert result[0]["symbol"] == "AAPL"
+        assert result[0]["pe"] != result[0]["pe"]  # NaN survives either decoder
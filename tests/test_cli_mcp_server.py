@@ -60,7 +60,7 @@ class TestSpecValidation:
     def test_valid_spec_exports_env_and_runs(self, runner):
         """Valid --tools should be exported as AIOFMP_MCP_TOOLS for register_tools."""
         with patch.dict(os.environ, {"FMP_API_KEY": "k"}, clear=True):
-            with patch("aiofmp.cli.asyncio.run") as mock_run:
+            with patch("aiofmp.cli.run_mcp_server") as mock_run:
                 mock_run.return_value = None
                 result = runner.invoke(
                     cli,
@@ -70,7 +70,7 @@ class TestSpecValidation:
                         "quote(get_stock_quote)",
                     ],
                 )
-                # CLI exports the spec into env before calling asyncio.run
+                # CLI exports the spec into env before starting the server
                 # so register_tools (inside run_server) can pick it up.
                 assert os.environ.get("AIOFMP_MCP_TOOLS") == "quote(get_stock_quote)"
         assert result.exit_code == 0
@@ -78,7 +78,7 @@ class TestSpecValidation:
 
     def test_exclude_only_exports_env(self, runner):
         with patch.dict(os.environ, {"FMP_API_KEY": "k"}, clear=True):
-            with patch("aiofmp.cli.asyncio.run") as mock_run:
+            with patch("aiofmp.cli.run_mcp_server") as mock_run:
                 mock_run.return_value = None
                 result = runner.invoke(
                     cli,
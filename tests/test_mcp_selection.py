@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
+
 import pytest
 
+import aiofmp
 from aiofmp.mcp_selection import (
     compute_selection,
     format_inventory,
     get_tool_inventory,
     parse_spec,
 )
+from aiofmp.search import SearchCategory
 
 
 @pytest.fixture
@@ -45,6 +50,37 @@ class TestInventory:
     def test_inventory_is_cached(self):
         assert get_tool_inventory() is get_tool_inventory()
 
+    def test_category_class_resolved_as_package_attribute(self):
+        assert aiofmp.SearchCategory is SearchCategory
+        assert "SearchCategory" in dir(aiofmp)
+
+    def test_client_categories_match_annotations(self):
+        client = aiofmp.FmpClient(api_key="k", search_cache_ttl=5.0)
+        annotations = aiofmp.FmpClient.__annotations__
+        assert annotations == {
+            name: class_name for class_name, name in aiofmp._CATEGORY_CLASSES.items()
+        }
+        for class_name, name in aiofmp._CATEGORY_CLASSES.items():
+            assert type(getattr(client, name)) is getattr(aiofmp, class_name)
+        assert client.search._cache_ttl == 5.0
+
+    def test_registering_tools_does_not_import_categories(self):
+        """Tool registration must not load category modules; only a client does."""
+        code = (
+            "import sys\n"
+            "from aiofmp.mcp_server import register_tools\n"
+            "register_tools()\n"
+            "assert 'aiofmp.search' not in sys.modules\n"
+            "assert 'aiofmp.statements' not in sys.modules\n"
+            "from aiofmp import FmpClient\n"
+            "assert FmpClient(api_key='k').search is not None\n"
+            "assert 'aiofmp.search' in sys.modules\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
+
 
 class TestParseSpec:
     def test_bare_category(self, fake_inventory):
@@ -6,135 +6,210 @@ in the aiofmp package.
 """
 
 import os
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from aiofmp import fmp_client
 from aiofmp.base import FMPAuthenticationError
 from aiofmp.fmp_client import get_fmp_client, reset_fmp_client
+from aiofmp.mcp_selection import get_tool_inventory
 from aiofmp.mcp_server import (
+    _mask_api_key,
     _resolve_selection_from_env,
     main,
+    mcp,
     register_tools,
     run_server,
 )
 
+_ENV_BASIC = {"FMP_API_KEY": "test_key"}
+_ENV_STDIO = {**_ENV_BASIC, "MCP_TRANSPORT": "stdio"}
+_ENV_HTTP = {
+    **_ENV_BASIC,
+    "MCP_TRANSPORT": "http",
+    "MCP_HOST": "localhost",
+    "MCP_PORT": "3000",
+}
+
+
+def _setenv(monkeypatch, env):
+    """Set every variable in ``env`` for the duration of the test."""
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+
+
+@pytest.fixture(autouse=True)
+def _reset_client():
+    """Drop the cached FMP client so no test sees another test's instance."""
+    reset_fmp_client()
+    yield
+    reset_fmp_client()
+
+
+class _RunAsyncRecorder:
+    """Stand-in for ``mcp.run_async`` that records its kwargs."""
+
+    def __init__(self):
+        self.calls = []
+        self.side_effect = None
+
+    async def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.side_effect is not None:
+            raise self.side_effect
+
+
+@pytest.fixture
+def mcp_run(monkeypatch):
+    """Install a recorder in place of ``mcp.run_async``; tests reconfigure it."""
+    recorder = _RunAsyncRecorder()
+    monkeypatch.setattr("aiofmp.mcp_server.mcp.run_async", recorder)
+    return recorder
+
 
 class TestMCPServer:
     """Test MCP server functionality."""
 
-    def setup_method(self):
-        """Reset the FMP client before each test."""
-        reset_fmp_client()
+    @pytest.mark.parametrize(
+        "env,check",
+        [(_ENV_BASIC, "created"), ({}, "missing"), (_ENV_BASIC, "singleton")],
+    )
+    def test_get_fmp_client(self, monkeypatch, env, check):
+        """Test FMP client creation, the missing-key error and caching."""
+        monkeypatch.delenv("FMP_API_KEY", raising=False)
+        _setenv(monkeypatch, env)
 
-    def test_get_fmp_client_creation(self):
-        """Test FMP client creation."""
-        with patch.dict(os.environ, {"FMP_API_KEY": "test_key"}):
-            client = get_fmp_client()
-            assert client is not None
-            assert client.api_key == "test_key"
-
-    def test_get_fmp_client_missing_api_key(self):
-        """Test FMP client creation with missing API key."""
-        with patch.dict(os.environ, {}, clear=True):
+        if check == "missing":
             with pytest.raises(
                 FMPAuthenticationError,
                 match="FMP_API_KEY environment variable is required",
             ):
                 get_fmp_client()
+            return
 
-    def test_get_fmp_client_singleton(self):
-        """Test that FMP client is a singleton."""
-        with patch.dict(os.environ, {"FMP_API_KEY": "test_key"}):
-            client1 = get_fmp_client()
-            client2 = get_fmp_client()
-            assert client1 is client2
-
-    @pytest.mark.asyncio
-    async def test_run_server_stdio(self):
-        """Test running server with STDIO transport."""
-        with patch.dict(
-            os.environ, {"FMP_API_KEY": "test_key", "MCP_TRANSPORT": "stdio"}
-        ):
-            with patch("aiofmp.mcp_server.mcp.run_async") as mock_run_async:
-                # Mock the run_async method to return a coroutine
-                async def mock_run_coro(*args, **kwargs):
-                    pass
+        client = get_fmp_client()
+        assert client.api_key == "test_key"
+        assert client.search._cache_ttl == fmp_client._SEARCH_CACHE_TTL
+        if check == "singleton":
+            assert get_fmp_client() is client
 
-                mock_run_async.return_value = mock_run_coro()
+    def test_get_fmp_client_rebuilds_only_after_reset(self, monkeypatch):
+        """Test that the environment is read once, until the client is reset."""
+        monkeypatch.setenv("FMP_API_KEY", "test_key")
+        client1 = get_fmp_client()
+        monkeypatch.setenv("FMP_API_KEY", "other_key")
+        assert get_fmp_client() is client1
 
-                await run_server()
-
-                mock_run_async.assert_called_once_with(transport="stdio")
-
-    @pytest.mark.asyncio
-    async def test_run_server_http(self):
-        """Test running server with HTTP transport."""
-        with patch.dict(
-            os.environ,
-            {
-                "FMP_API_KEY": "test_key",
-                "MCP_TRANSPORT": "http",
-                "MCP_HOST": "localhost",
-                "MCP_PORT": "3000",
-            },
-        ):
-            with patch("aiofmp.mcp_server.mcp.run_async") as mock_run_async:
-                # Mock the run_async method to return a coroutine
-                async def mock_run_coro(*args, **kwargs):
-                    pass
+        reset_fmp_client()
+        client2 = get_fmp_client()
+        assert client2 is not client1
+        assert client2.api_key == "other_key"
 
-                mock_run_async.return_value = mock_run_coro()
+    async def test_run_server_stdio(self, monkeypatch, mcp_run):
+        """Test running server with STDIO transport."""
+        _setenv(monkeypatch, _ENV_STDIO)
 
-                await run_server()
+        await run_server()
 
-                mock_run_async.assert_called_once_with(
-                    transport="http", host="localhost", port=3000
-                )
+        assert mcp_run.calls == [{"transport": "stdio"}]
 
-    @pytest.mark.asyncio
-    async def test_run_server_missing_api_key(self):
+    async def test_run_server_http(self, monkeypatch, mcp_run):
+        """Test running server with HTTP transport."""
+        _setenv(monkeypatch, _ENV_HTTP)
+
+        await run_server()
+
+        assert mcp_run.calls == [
+            {"transport": "http", "host": "localhost", "port": 3000}
+        ]
+
+    @pytest.mark.parametrize(
+        "env,expected",
+        [
+            (_ENV_BASIC, {"transport": "stdio"}),
+            (
+                {**_ENV_BASIC, "MCP_TRANSPORT": "HTTP"},
+                {"transport": "http", "host": "localhost", "port": 3000},
+            ),
+            (
+                {**_ENV_HTTP, "MCP_PORT": "8080"},
+                {"transport": "http", "host": "localhost", "port": 8080},
+            ),
+        ],
+    )
+    async def test_run_server_transport_defaults(
+        self, monkeypatch, mcp_run, env, expected
+    ):
+        """Unset transport settings fall back to stdio, localhost and port 3000."""
+        for name in ("MCP_TRANSPORT", "MCP_HOST", "MCP_PORT"):
+            monkeypatch.delenv(name, raising=False)
+        _setenv(monkeypatch, env)
+
+        await run_server()
+
+        assert mcp_run.calls == [expected]
+
+    async def test_run_server_closes_client_on_shutdown(self, monkeypatch, mcp_run):
+        """The shared client's connector is closed when the server stops."""
+        _setenv(monkeypatch, _ENV_BASIC)
+        client = get_fmp_client()
+        async with client:
+            pass
+        connector = client._connector
+
+        await run_server()
+
+        assert connector.closed
+        assert get_fmp_client() is not client
+
+    async def test_run_server_missing_api_key(self, monkeypatch):
         """Test running server with missing API key."""
-        with patch.dict(os.environ, {}, clear=True):
-            with patch("sys.exit") as mock_exit:
-                # Mock sys.exit to raise SystemExit to prevent further execution
-                mock_exit.side_effect = SystemExit(1)
+        # Make the exit hook raise SystemExit to prevent further execution
+        mock_exit = MagicMock(side_effect=SystemExit(1))
+        monkeypatch.setattr("aiofmp.mcp_server._exit", mock_exit)
 
-                with pytest.raises(SystemExit):
-                    await run_server()
+        monkeypatch.delenv("FMP_API_KEY", raising=False)
+        with pytest.raises(SystemExit):
+            await run_server()
 
-                mock_exit.assert_called_once_with(1)
+        mock_exit.assert_called_once_with(1)
 
-    @pytest.mark.asyncio
-    async def test_run_server_keyboard_interrupt(self):
+    async def test_run_server_keyboard_interrupt(self, monkeypatch, mcp_run):
         """Test handling keyboard interrupt."""
-        with patch.dict(os.environ, {"FMP_API_KEY": "test_key"}):
-            with patch("aiofmp.mcp_server.mcp.run_async") as mock_run_async:
-                # Mock the run_async method to raise KeyboardInterrupt
-                async def mock_run_coro(*args, **kwargs):
-                    raise KeyboardInterrupt()
-
-                mock_run_async.return_value = mock_run_coro()
+        _setenv(monkeypatch, _ENV_BASIC)
+        mcp_run.side_effect = KeyboardInterrupt()
 
-                await run_server()
+        # The interrupt is swallowed; any exception escaping fails the test
+        await run_server()
 
-                # Should not raise an exception
-                assert True
+        assert len(mcp_run.calls) == 1
 
-    @pytest.mark.asyncio
-    async def test_run_server_general_exception(self):
+    async def test_run_server_general_exception(self, monkeypatch, mcp_run):
         """Test handling general exceptions."""
-        with patch.dict(os.environ, {"FMP_API_KEY": "test_key"}):
-            with patch("aiofmp.mcp_server.mcp.run_async") as mock_run_async:
-                mock_run_async.side_effect = Exception("Server error")
+        _setenv(monkeypatch, _ENV_BASIC)
+        mcp_run.side_effect = Exception("Server error")
+        mock_exit = MagicMock()
+        monkeypatch.setattr("aiofmp.mcp_server._exit", mock_exit)
+
+        await run_server()
 
-                with patch("sys.exit") as mock_exit:
-                    await run_server()
-                    mock_exit.assert_called_once_with(1)
+        mock_exit.assert_called_once_with(1)
+
+    @pytest.mark.parametrize(
+        "api_key,expected",
+        [("abcdefgh1234", "********1234"), ("abcd", "****"), ("ab", "****")],
+    )
+    def test_mask_api_key(self, api_key, expected):
+        """Test that only the last four characters of the API key are shown."""
+        assert _mask_api_key(api_key) == expected
 
     def test_main_function(self):
         """Test main function entry point."""
-        with patch("aiofmp.mcp_server.asyncio.run") as mock_asyncio_run:
+        with (
+            patch("aiofmp.mcp_server.uvloop", None),
+            patch("aiofmp.mcp_server.asyncio.run") as mock_asyncio_run,
+        ):
             main()
 
             # Verify that asyncio.run was called once
@@ -143,6 +218,21 @@ class TestMCPServer:
             args, _ = mock_asyncio_run.call_args
             # We can't easily test the exact coroutine object, so just verify it was called
             assert len(args) == 1
+            args[0].close()
+
+    def test_main_function_uses_uvloop_when_installed(self):
+        """main() should hand the server coroutine to uvloop.run if available."""
+        mock_uvloop = MagicMock()
+        with (
+            patch("aiofmp.mcp_server.uvloop", mock_uvloop),
+            patch("aiofmp.mcp_server.asyncio.run") as mock_asyncio_run,
+        ):
+            main()
+
+        mock_asyncio_run.assert_not_called()
+        mock_uvloop.run.assert_called_once()
+        args, _ = mock_uvloop.run.call_args
+        args[0].close()
 
 
 # Error handler tests removed - FastMCP doesn't support global error handlers
@@ -152,35 +242,10 @@ class TestMCPServer:
 class TestMCPServerConfiguration:
     """Test MCP server configuration."""
 
-    def test_environment_variables(self):
+    def test_environment_variables(self, monkeypatch):
         """Test environment variable configuration."""
-        with patch.dict(
-            os.environ,
-            {
-                "FMP_API_KEY": "test_key",
-                "MCP_TRANSPORT": "http",
-                "MCP_HOST": "localhost",
-                "MCP_PORT": "3000",
-            },
-        ):
-            assert os.getenv("FMP_API_KEY") == "test_key"
-            assert os.getenv("MCP_TRANSPORT") == "http"
-            assert os.getenv("MCP_HOST") == "localhost"
-            assert os.getenv("MCP_PORT") == "3000"
-
-    def test_default_configuration(self):
-        """Test default configuration values."""
-        with patch.dict(os.environ, {}, clear=True):
-            assert os.getenv("MCP_TRANSPORT", "stdio") == "stdio"
-            assert os.getenv("MCP_HOST", "localhost") == "localhost"
-            assert os.getenv("MCP_PORT", "3000") == "3000"
-
-    def test_port_conversion(self):
-        """Test port string to integer conversion."""
-        with patch.dict(os.environ, {"MCP_PORT": "8080"}):
-            port = int(os.getenv("MCP_PORT", "3000"))
-            assert port == 8080
-            assert isinstance(port, int)
+        _setenv(monkeypatch, _ENV_HTTP)
+        assert {name: os.environ[name] for name in _ENV_HTTP} == _ENV_HTTP
 
 
 class TestRegisterToolsSelection:
@@ -236,15 +301,12 @@ class TestRegisterToolsSelection:
         Mocks importlib + remove_tool so the global `mcp` instance shared with
         other tests isn't mutated.
         """
-        from aiofmp.mcp_selection import get_tool_inventory
-        from aiofmp.mcp_server import mcp as mcp_instance
-
         selection = {
             "quote": frozenset({"get_stock_quote"}),
             "search": frozenset(),  # whole-category drop after import
         }
         with patch("aiofmp.mcp_server.importlib.import_module") as mock_import:
-            with patch.object(mcp_instance, "remove_tool") as mock_remove:
+            with patch.object(mcp, "remove_tool") as mock_remove:
                 register_tools(selection=selection)
 
         imported = {call.args[0] for call in mock_import.call_args_list}
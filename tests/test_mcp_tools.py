@@ -5,6 +5,7 @@ This module provides comprehensive unit tests for all MCP tools
 in the aiofmp package.
 """
 
+import json
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -12,10 +13,14 @@ import pytest
 from aiofmp.chart_tools import get_historical_price_full, get_intraday_1min
 from aiofmp.company_tools import get_company_profile, get_market_cap
 from aiofmp.mcp_tools import (
+    create_summary_stats,
     create_tool_response,
+    format_large_number,
+    handle_async_operation,
     validate_date,
     validate_limit,
     validate_symbol,
+    validate_symbols,
 )
 from aiofmp.search_tools import screen_stocks, search_companies, search_symbols
 
@@ -52,6 +57,54 @@ class TestMCPToolsUtilities:
         assert response.structured_content["data"] is None
         assert response.structured_content["message"] == "Error message"
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize(
+        "price", [150.0, 2**64, float("nan")], ids=["float", "big-int", "nan"]
+    )
+    def test_create_tool_response_text_content(self, monkeypatch, use_orjson, price):
+        """Test that text content round-trips to the structured content."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr("aiofmp.mcp_tools.orjson", None)
+        monkeypatch.setenv("MCP_INCLUDE_TEXT_CONTENT", "true")
+
+        data = [{"symbol": "AAPL", "price": price, "name": "Société Générale"}]
+        response = create_tool_response(data, success=True)
+
+        decoded = json.loads(response.content[0].text)
+        if use_orjson and price != price:
+            # orjson renders NaN as null, which unlike NaN is valid JSON
+            assert decoded["data"][0]["price"] is None
+            decoded["data"][0]["price"] = price
+        # Compare stdlib renderings, since NaN never compares equal to itself
+        assert json.dumps(decoded) == json.dumps(response.structured_content)
+        assert json.dumps(response.structured_content["data"]) == json.dumps(data)
+
+    @pytest.mark.asyncio
+    async def test_handle_async_operation(self):
+        """Test the decorator wraps results and errors in tool responses."""
+
+        @handle_async_operation("fetch quote")
+        async def fetch(symbol: str) -> dict:
+            """Fetch a quote."""
+            if symbol == "BAD":
+                raise ValueError("unknown symbol")
+            return {"symbol": symbol}
+
+        assert fetch.__name__ == "fetch"
+        assert fetch.__doc__ == "Fetch a quote."
+
+        ok = await fetch("AAPL")
+        assert ok.structured_content == {"success": True, "data": {"symbol": "AAPL"}}
+
+        failed = await fetch("BAD")
+        assert failed.structured_content == {
+            "success": False,
+            "data": None,
+            "message": "Error in fetch quote: unknown symbol",
+        }
+
     def test_validate_symbol_valid(self):
         """Test validating a valid symbol."""
         result = validate_symbol("AAPL")
@@ -70,6 +123,22 @@ class TestMCPToolsUtilities:
         with pytest.raises(ValueError, match="Symbol must be a non-empty string"):
             validate_symbol(None)
 
+    def test_validate_symbols_valid(self):
+        """Test validating a comma-separated symbol list."""
+        assert validate_symbols("AAPL") == ["AAPL"]
+        assert validate_symbols(" aapl, msft ,,BRK.B ") == ["AAPL", "MSFT", "BRK.B"]
+
+    def test_validate_symbols_invalid(self):
+        """Test validating an invalid symbol list."""
+        with pytest.raises(ValueError, match="Symbols must be a non-empty string"):
+            validate_symbols("")
+
+        with pytest.raises(ValueError, match="Symbols must be a non-empty string"):
+            validate_symbols(None)
+
+        with pytest.raises(ValueError, match="Symbols cannot be empty"):
+            validate_symbols(" , ,")
+
     def test_validate_date_valid(self):
         """Test validating a valid date."""
         result = validate_date("2025-01-01")
@@ -88,6 +157,12 @@ class TestMCPToolsUtilities:
         with pytest.raises(ValueError, match="Date must be in YYYY-MM-DD format"):
             validate_date("2025-1-1")
 
+        with pytest.raises(ValueError, match="Date must be in YYYY-MM-DD format"):
+            validate_date("2025-01-1a")
+
+        with pytest.raises(ValueError, match="Date must be in YYYY-MM-DD format"):
+            validate_date("2025-01-01\n")
+
     def test_validate_limit_valid(self):
         """Test validating a valid limit."""
         result = validate_limit(10)
@@ -109,6 +184,47 @@ class TestMCPToolsUtilities:
         with pytest.raises(ValueError, match="Limit cannot exceed 10000"):
             validate_limit(10001)
 
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (None, "N/A"),
+            (0, "0.00"),
+            (999.994, "999.99"),
+            (1000, "1.00K"),
+            (999_999, "1000.00K"),
+            (2_500_000, "2.50M"),
+            (3.2e9, "3.20B"),
+            (1e12, "1.00T"),
+            (4.5e15, "4500.00T"),
+            (-7.25e9, "-7.25B"),
+            (0.5, "0.50"),
+        ],
+    )
+    def test_format_large_number(self, value, expected):
+        """Test large number formatting with magnitude suffixes."""
+        assert format_large_number(value) == expected
+
+    def test_create_summary_stats_small(self):
+        """Test summary statistics for a small list, skipping missing values."""
+        data = [{"price": 10}, {"price": None}, {"price": 30}, {}]
+        result = create_summary_stats(data, "price")
+        assert result == {"count": 2, "min": 10, "max": 30, "avg": 20.0}
+
+    def test_create_summary_stats_empty(self):
+        """Test summary statistics with no data or no matching values."""
+        assert create_summary_stats([], "price") == {
+            "count": 0,
+            "min": None,
+            "max": None,
+            "avg": None,
+        }
+        assert create_summary_stats([{"volume": 1}], "price") == {
+            "count": 1,
+            "min": None,
+            "max": None,
+            "avg": None,
+        }
+
 
 class TestSearchTools:
     """Test search category MCP tools."""
@@ -2,6 +2,7 @@
 Unit tests for FMP Search category
 """
 
+import inspect
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -25,6 +26,11 @@ class TestSearchCategory:
         """Search category instance with mocked client"""
         return SearchCategory(mock_client)
 
+    @pytest.fixture
+    def cached_search_category(self, mock_client):
+        """Search category instance with its TTL cache enabled"""
+        return SearchCategory(mock_client, cache_ttl=60.0)
+
     @pytest.mark.asyncio
     async def test_symbols_search_basic(self, search_category, mock_client):
         """Test basic symbol search"""
@@ -340,3 +346,113 @@ class TestSearchCategory:
         mock_client._make_request.assert_called_once_with(
             "company-screener", {"sector": "Technology", "limit": 100}
         )
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled_by_default(self, search_category, mock_client):
+        """Test that without a cache_ttl every query reaches the API"""
+        mock_client._make_request.return_value = []
+
+        await search_category.symbols("AAPL", limit=10)
+        await search_category.symbols("AAPL", limit=10)
+
+        assert mock_client._make_request.call_count == 2
+        assert not search_category._cache
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_served_from_cache(
+        self, cached_search_category, mock_client
+    ):
+        """Test that an identical query within the TTL hits the API once"""
+        mock_client._make_request.return_value = [{"symbol": "AAPL"}]
+
+        first = await cached_search_category.symbols("AAPL", limit=10)
+        second = await cached_search_category.symbols("AAPL", limit=10)
+
+        assert first == second == [{"symbol": "AAPL"}]
+        mock_client._make_request.assert_called_once_with(
+            "search-symbol", {"query": "AAPL", "limit": 10}
+        )
+
+    @pytest.mark.asyncio
+    async def test_cache_keyed_on_endpoint_and_params(
+        self, cached_search_category, mock_client
+    ):
+        """Test that different endpoints or params are cached separately"""
+        mock_client._make_request.return_value = []
+
+        await cached_search_category.symbols("AAPL")
+        await cached_search_category.symbols("AAPL", exchange="NASDAQ")
+        await cached_search_category.companies("AAPL")
+
+        assert mock_client._make_request.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_cache_entry_expires_after_ttl(
+        self, cached_search_category, mock_client, monkeypatch
+    ):
+        """Test that an expired entry is fetched again"""
+        mock_client._make_request.return_value = []
+        now = 1000.0
+        monkeypatch.setattr("aiofmp.search.time.monotonic", lambda: now)
+
+        await cached_search_category.companies("Apple")
+        now += 61
+        await cached_search_category.companies("Apple")
+
+        assert mock_client._make_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_large_limit_bypasses_cache(
+        self, cached_search_category, mock_client
+    ):
+        """Test that bulk screens above the cache limit are never cached"""
+        mock_client._make_request.return_value = []
+        limit = SearchCategory._CACHE_MAX_LIMIT + 1
+
+        await cached_search_category.screener(sector="Technology", limit=limit)
+        await cached_search_category.screener(sector="Technology", limit=limit)
+
+        assert mock_client._make_request.call_count == 2
+        assert not cached_search_category._cache
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(
+        self, cached_search_category, mock_client, monkeypatch
+    ):
+        """Test that the cache is bounded by its maxsize"""
+        mock_client._make_request.return_value = []
+        monkeypatch.setattr(SearchCategory, "_CACHE_MAXSIZE", 2)
+
+        await cached_search_category.symbols("A")
+        await cached_search_category.symbols("B")
+        await cached_search_category.symbols("A")  # refresh A
+        await cached_search_category.symbols("C")  # evicts B
+        await cached_search_category.symbols("A")
+        await cached_search_category.symbols("B")
+
+        assert mock_client._make_request.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_screener_cached_on_field_values(
+        self, cached_search_category, mock_client
+    ):
+        """Test that screener caches on its fixed-order field values"""
+        mock_client._make_request.return_value = []
+
+        await cached_search_category.screener(sector="Technology", limit=10)
+        await cached_search_category.screener(limit=10, sector="Technology")
+        await cached_search_category.screener(sector="Technology", limit=20)
+
+        assert mock_client._make_request.call_count == 2
+        for endpoint, values in cached_search_category._cache:
+            assert endpoint == "company-screener"
+            assert len(values) == len(SearchCategory._SCREENER_FIELDS)
+
+    def test_screener_field_table_matches_signature(self):
+        """Test that every screener keyword has exactly one API param mapping"""
+        kwargs = [
+            name
+            for name in inspect.signature(SearchCategory.screener).parameters
+            if name != "self"
+        ]
+        assert [name for name, _ in SearchCategory._SCREENER_FIELDS] == kwargs